@@ -6,7 +6,9 @@ Before running:
 2. Set it as env var: export OPENWEATHERMAP_API_KEY='your-key'
     OR pass it directly to the client
 """
-from openweather_python import OpenWeatherMapClient
+import asyncio
+
+from openweather_python import OpenWeatherMapClient, AsyncOpenWeatherMapClient
 from openweather_python.exceptions import (
     AuthenticationError, WrongCoords, RateLimitError, PyOpenWeatherMapError
 )
@@ -65,11 +67,11 @@ def example_with_units():
     print(f"Standard: {weather_standard.main.temp}K")
 
 def example_multiple_cities():
-    """Check weather for multiple cities."""
+    """Check weather for multiple cities concurrently."""
     print("\n" + "=" * 60)
     print("Example 3: Multiple Cities")
     print("=" * 60)
-    
+
     cities = {
         "London": (51.5074, -0.1278),
         "Paris": (48.8566, 2.3522),
@@ -77,23 +79,28 @@ def example_multiple_cities():
         "New York": (40.7128, -74.0060),
         "Sydney": (-33.8688, 151.2093),
     }
-    
-    client = OpenWeatherMapClient()
-    
+
+    async def fetch_all():
+        # All cities are fetched concurrently - one round-trip instead of five
+        async with AsyncOpenWeatherMapClient() as client:
+            return await client.get_many(cities.values())
+
     print(f"\n{'City':<15} {'Temp':<8} {'Condition':<25} {'Humidity'}")
     print("-" * 60)
-    
-    for city_name, (lat, lon) in cities.items():
-        try:
-            weather = client.get_current_weather_by_coords(lat, lon)
-            print(
-                f"{city_name:<15} "
-                f"{weather.main.temp}°{'':<4} "
-                f"{weather.weather[0].description:<25} "
-                f"{weather.main.humidity}%"
-            )
-        except Exception as e:
-            print(f"{city_name:<15} Error: {e}")
+
+    try:
+        results = asyncio.run(fetch_all())
+    except Exception as e:
+        print(f"Error: {e}")
+        return
+
+    for city_name, weather in zip(cities, results):
+        print(
+            f"{city_name:<15} "
+            f"{weather.main.temp}°{'':<4} "
+            f"{weather.weather[0].description:<25} "
+            f"{weather.main.humidity}%"
+        )
 
 def example_error_handling():
     """Demonstrate proper error handling."""
@@ -9,19 +9,19 @@ Example usage:
     >>> weather = client.get_current_weather_by_coords(lat=44.34, lon=10.99)
     >>> print(f"Temperature: {weather.main.temp}°")
 """
-from .client import OpenWeatherMapClient
+from .client import OpenWeatherMapClient, AsyncOpenWeatherMapClient
 from .models import (
     CurrentWeather, Coordinates, Weather,
     Main, Wind, Clouds, Rain, Snow, Sys
 )
 from .exceptions import (
     PyOpenWeatherMapError, AuthenticationError, APIError,
-    WrongCoords, RateLimitError, InvalidParameterError,
+    WrongCoords, NotFoundError, RateLimitError, InvalidParameterError,
 )
 
 __all__ = [
-    # Main client
-    OpenWeatherMapClient,
+    # Main clients
+    OpenWeatherMapClient, AsyncOpenWeatherMapClient,
 
     # Models
     CurrentWeather, Coordinates, Weather,
@@ -29,5 +29,5 @@ __all__ = [
 
     # Exceptions
     PyOpenWeatherMapError, AuthenticationError, APIError,
-    WrongCoords, RateLimitError, InvalidParameterError
+    WrongCoords, NotFoundError, RateLimitError, InvalidParameterError
 ]
\ No newline at end of file
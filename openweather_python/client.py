@@ -1,17 +1,51 @@
 """Main client for OpenWeatherMapAPI"""
+import asyncio
 import os
-from typing import Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from sys import intern as _intern
+from typing import List, Optional, Tuple, Union
 import requests
+from requests.adapters import HTTPAdapter, Retry
+
+# aiohttp is only needed for the async client
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# Pick the fastest available JSON decoder - msgspec and orjson both parse
+# the raw response bytes in C, several times faster than the stdlib decoder
+# used by response.json(). Fall back to stdlib json if neither is installed.
+try:
+    import msgspec.json
+    _loads = msgspec.json.decode
+    _decode_error = msgspec.DecodeError
+except ImportError:
+    try:
+        import orjson
+        _loads = orjson.loads
+        _decode_error = orjson.JSONDecodeError
+    except ImportError:
+        import json
+        _loads = json.loads
+        _decode_error = json.JSONDecodeError
+
+# What _loads can raise on a malformed or non-bytes body
+_DECODE_ERRORS = (_decode_error, ValueError, TypeError)
 
 from .constants import (
     BASE_URL,
     CURRENT_WEATHER_ENDPOINT,
+    CURRENT_WEATHER_URL,
+    DEFAULT_CACHE_TTL,
     DEFAULT_TIMEOUT,
     DEFAULT_UNITS,
     VALID_UNITS
 )
 from .exceptions import (
     AuthenticationError,
+    NotFoundError,
     RateLimitError,
     InvalidParameterError,
     PyOpenWeatherMapError,
@@ -19,22 +53,51 @@ from .exceptions import (
 )
 from .models import CurrentWeather
 
+# O(1) dispatch from status code to exception for the statuses with a
+# fixed message; 400 is handled separately since its message comes from
+# the response body
+_STATUS_EXCEPTIONS = {
+    401: (AuthenticationError, 'Invalid API key'),
+    404: (NotFoundError, 'Location not found'),
+    429: (RateLimitError, 'API rate limit exceeded'),
+}
+
+def _parse_max_age(cache_control) -> Optional[int]:
+    """
+    Extract the max-age value (in secs) from a Cache-Control header.
+
+    Returns None if the header is missing or has no usable max-age.
+    """
+    if not isinstance(cache_control, str):
+        return None
+    for directive in cache_control.split(','):
+        name, _, value = directive.strip().partition('=')
+        if name == 'max-age':
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
 class OpenWeatherMapClient:
     """Client for interacting with OpenWeatherMapAPI"""
     def __init__(
         self,
         api_key: Optional[str] = None,
         units: str = DEFAULT_UNITS,
-        timeout: int = DEFAULT_TIMEOUT
+        timeout: int = DEFAULT_TIMEOUT,
+        cache_ttl: int = DEFAULT_CACHE_TTL
     ):
         """
         Initialize OpenWeatherMap client.
 
         Args:
-            api_key: OpenWeatherMap API key. If not provided, looks for 
+            api_key: OpenWeatherMap API key. If not provided, looks for
                 OPENWEATHERMAP_API_KEY env variable
             units: Temp units ('metric', 'imperial', or 'standard')
             timeout: Request timeout in secs
+            cache_ttl: How long (in secs) to reuse a fetched weather result
+                for the same coordinates. Set to 0 to disable caching
 
         Raises:
             AuthenticationError: If no API key is provided
@@ -48,26 +111,75 @@ class OpenWeatherMapClient:
                 "OPENWEATHERMAP_API_KEY environment variable"
             )
         
-        # Validate units
+        # Validate units; interning makes the membership probe (and later
+        # comparisons) an identity check against the literal set members
+        units = _intern(units)
         if units not in VALID_UNITS:
             raise InvalidParameterError(
-                f"Units must be one of {VALID_UNITS}, got '{units}'"
+                f"Units must be one of {set(VALID_UNITS)}, got '{units}'"
             )
         
         self.units = units
         self.timeout = timeout
         self.base_url = BASE_URL
 
-    def _make_request(self, endpoint: str, params: dict) -> dict:
+        # Precompute what every request needs - the query params that never
+        # change and the full endpoint URLs - so the per-call path does no
+        # repeated string formatting. Params are kept as a tuple of pairs:
+        # requests accepts pair sequences directly and a list extended from
+        # this is cheaper to build than a fresh dict per call
+        self._base_params = (('units', units), ('appid', self.api_key))
+        self._url_cache = {CURRENT_WEATHER_ENDPOINT: CURRENT_WEATHER_URL}
+
+        # Weather changes on the order of minutes, so short-lived results
+        # can be served from memory instead of re-hitting the network.
+        # Keyed by (lat, lon, units); values are (fetched_at, ttl, weather)
+        self._cache = {}
+        self._cache_ttl = cache_ttl
+
+        # ETags for conditional requests, keyed by the full request. When a
+        # result expires from the TTL cache, revalidating with If-None-Match
+        # lets the server answer 304 with no body at all
+        self._etag_cache = {}
+
+        # Reuse one pooled session so repeated calls to the API keep the
+        # TCP+TLS connection alive instead of paying the handshake each time
+        self._session = requests.Session()
+        self._session.mount('https://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=[502, 503, 504]
+            )
+        ))
+
+    def close(self):
+        """Close the underlying HTTP session and its pooled connections"""
+        self._session.close()
+
+    def __enter__(self) -> 'OpenWeatherMapClient':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _make_request(
+        self, endpoint: str, params: Union[dict, List[tuple]]
+    ) -> Tuple[dict, Optional[int]]:
         """
         Make HTTP request to OpenWeatherMap API
 
         Args:
             endpoint: API endpoint path (e.g., '/weather')
-            params: Query params
+            params: Query params, as a dict or a sequence of (key, value)
+                pairs. Pair sequences are expected to already carry 'appid'
 
         Returns:
-            JSON response as dict
+            Tuple of (JSON response as dict, Cache-Control max-age in secs
+            or None). The max-age rides along with the body so concurrent
+            callers never read another request's freshness hint
 
         Raises:
             AuthenticationError: Invalid API key
@@ -76,29 +188,60 @@ class OpenWeatherMapClient:
             PyOpenWeatherMapError: Other API errors
         """
         # Add API key to params
-        params['appid'] = self.api_key
+        if isinstance(params, dict):
+            params['appid'] = self.api_key
 
-        # Construct full URL
-        url = f"{BASE_URL}{endpoint}"
+        # Look up the precomputed URL; fall back to building (and caching)
+        # it for endpoints we have not seen yet
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self._url_cache[endpoint] = f"{BASE_URL}{endpoint}"
+
+        # If we hold an ETag for this exact request, ask the server to
+        # revalidate - a 304 carries no body to transfer or parse
+        etag_key = (
+            endpoint,
+            tuple(sorted(params.items())) if isinstance(params, dict) else tuple(params)
+        )
+        etag_entry = self._etag_cache.get(etag_key)
+        headers = {'If-None-Match': etag_entry[0]} if etag_entry is not None else None
 
         try:
-            response = requests.get(url=url, params=params, timeout=self.timeout)
+            response = self._session.get(
+                url=url, params=params, timeout=self.timeout, headers=headers
+            )
+
+            # The server's freshness hint is returned alongside the body
+            max_age = _parse_max_age(response.headers.get('Cache-Control'))
 
             # Handle different status codes
             if response.status_code == 200:
-                return response.json()
+                # Decode the raw bytes directly - skips the charset sniffing
+                # and str decode done by response.json()
+                data = _loads(response.content)
+                etag = response.headers.get('ETag')
+                if isinstance(etag, str):
+                    self._etag_cache[etag_key] = (etag, data)
+                return data, max_age
+            elif response.status_code == 304 and etag_entry is not None:
+                # Not modified - reuse the previously decoded body
+                return etag_entry[1], max_age
             elif response.status_code == 400:
-                error_msg = response.json().get('message', 'wrong latitude or longitude')
+                try:
+                    error_msg = _loads(response.content).get('message', 'wrong latitude or longitude')
+                except _DECODE_ERRORS:
+                    error_msg = 'wrong latitude or longitude'
                 raise WrongCoords(error_msg)
-            elif response.status_code == 401:
-                raise AuthenticationError('Invalid API key')
-            elif response.status_code == 429:
-                raise RateLimitError('API rate limit exceeded')
+
+            handled = _STATUS_EXCEPTIONS.get(response.status_code)
+            if handled is not None:
+                exc_cls, msg = handled
+                raise exc_cls(msg)
             else:
                 # Try to get the error message
                 try:
-                    error_msg = response.json().get('message', 'Unknown error')
-                except:
+                    error_msg = _loads(response.content).get('message', 'Unknown error')
+                except _DECODE_ERRORS:
                     error_msg = f"HTTP {response.status_code}"
                 raise PyOpenWeatherMapError(f'API error: {error_msg}')
         except requests.exceptions.Timeout:
@@ -116,12 +259,242 @@ class OpenWeatherMapClient:
 
         Returns:
             CurrentWeather object with parsed weather data
+
+        Raises:
+            WrongCoords: If lat/lon are outside the valid range
         """
-        params = {
-            'lat': lat,
-            'lon': lon,
-            'units': self.units
-        }
+        # Reject out-of-range coordinates locally - the API would only
+        # return a 400 after a full round-trip, which also counts against
+        # the rate limit
+        lat = float(lat)
+        lon = float(lon)
+        if not (-90.0 <= lat <= 90.0 and -180.0 <= lon <= 180.0):
+            raise WrongCoords(f"lat={lat}, lon={lon} out of range")
+
+        # Serve fresh results straight from the in-process cache
+        cache_key = (round(lat, 2), round(lon, 2), self.units)
+        if self._cache_ttl > 0:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                fetched_at, ttl, weather = cached
+                if time.monotonic() - fetched_at < ttl:
+                    return weather
+
+        # Start from the precomputed units/appid params and add only the
+        # per-call coordinates
+        params = [('lat', lat), ('lon', lon), *self._base_params]
+
+        data, max_age = self._make_request(CURRENT_WEATHER_ENDPOINT, params)
+        weather = CurrentWeather.from_api_response(data)
+
+        if self._cache_ttl > 0:
+            # Prefer the server's Cache-Control max-age when it sends one
+            ttl = max_age if max_age is not None else self._cache_ttl
+            self._cache[cache_key] = (time.monotonic(), ttl, weather)
+
+        return weather
+
+    def get_many(self, coord_list: List[Tuple[float, float]]) -> List[CurrentWeather]:
+        """
+        Get current weather for multiple coordinates using a thread pool
+
+        requests releases the GIL during network I/O, so the lookups
+        overlap and the batch completes in roughly one round-trip. The
+        pooled session is shared safely across the worker threads.
 
-        data = self._make_request(CURRENT_WEATHER_ENDPOINT, params)
-        return CurrentWeather.from_api_response(data)
\ No newline at end of file
+        Args:
+            coord_list: Iterable of (lat, lon) pairs
+
+        Returns:
+            List of CurrentWeather objects, in the same order as coord_list
+        """
+        coord_list = list(coord_list)
+        if not coord_list:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(8, len(coord_list))) as executor:
+            return list(executor.map(
+                lambda coords: self.get_current_weather_by_coords(*coords),
+                coord_list
+            ))
+
+class AsyncOpenWeatherMapClient:
+    """
+    Async client for interacting with OpenWeatherMapAPI.
+
+    Issues requests concurrently via aiohttp, so fetching weather for N
+    locations costs roughly one network round-trip instead of N.
+
+    Example usage:
+        >>> async with AsyncOpenWeatherMapClient(api_key="<KEY>") as client:
+        ...     weather = await client.get_current_weather_by_coords(51.51, -0.13)
+    """
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        units: str = DEFAULT_UNITS,
+        timeout: int = DEFAULT_TIMEOUT
+    ):
+        """
+        Initialize async OpenWeatherMap client.
+
+        Args:
+            api_key: OpenWeatherMap API key. If not provided, looks for
+                OPENWEATHERMAP_API_KEY env variable
+            units: Temp units ('metric', 'imperial', or 'standard')
+            timeout: Request timeout in secs
+
+        Raises:
+            AuthenticationError: If no API key is provided
+            InvalidParameterError: If invalid units are specified
+            PyOpenWeatherMapError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise PyOpenWeatherMapError(
+                "aiohttp is required for AsyncOpenWeatherMapClient. "
+                "Install it with: pip install openweather_python[async]"
+            )
+
+        # Get API key from param or env
+        self.api_key = api_key or os.getenv('OPENWEATHERMAP_API_KEY')
+        if not self.api_key:
+            raise AuthenticationError(
+                "API key is required. Provide via parameter or "
+                "OPENWEATHERMAP_API_KEY environment variable"
+            )
+
+        # Validate units; interning makes the membership probe (and later
+        # comparisons) an identity check against the literal set members
+        units = _intern(units)
+        if units not in VALID_UNITS:
+            raise InvalidParameterError(
+                f"Units must be one of {set(VALID_UNITS)}, got '{units}'"
+            )
+
+        self.units = units
+        self.timeout = timeout
+        self.base_url = BASE_URL
+        self._session = None
+
+        # Same precomputed endpoint URLs as the sync client
+        self._url_cache = {CURRENT_WEATHER_ENDPOINT: CURRENT_WEATHER_URL}
+
+    async def __aenter__(self) -> 'AsyncOpenWeatherMapClient':
+        self._session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.timeout)
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self._session.close()
+        self._session = None
+
+    async def _make_request(self, endpoint: str, params: Union[dict, List[tuple]]) -> dict:
+        """
+        Make async HTTP request to OpenWeatherMap API
+
+        Args:
+            endpoint: API endpoint path (e.g., '/weather')
+            params: Query params, as a dict or a sequence of (key, value)
+                pairs. Pair sequences are expected to already carry 'appid'
+
+        Returns:
+            JSON response as dict
+
+        Raises:
+            AuthenticationError: Invalid API key
+            WrongCoords: Invalid coordinates
+            RateLimitError: Rate limit exceeded
+            PyOpenWeatherMapError: Other API errors
+        """
+        if self._session is None:
+            raise PyOpenWeatherMapError(
+                "Client session is not open. Use 'async with' to open it"
+            )
+
+        # Add API key to params
+        if isinstance(params, dict):
+            params['appid'] = self.api_key
+
+        # Look up the precomputed URL; fall back to building (and caching)
+        # it for endpoints we have not seen yet
+        url = self._url_cache.get(endpoint)
+        if url is None:
+            url = self._url_cache[endpoint] = f"{BASE_URL}{endpoint}"
+
+        try:
+            async with self._session.get(url, params=params) as response:
+                # Handle different status codes
+                if response.status == 200:
+                    return _loads(await response.read())
+                elif response.status == 400:
+                    try:
+                        error_msg = _loads(await response.read()).get(
+                            'message', 'wrong latitude or longitude'
+                        )
+                    except _DECODE_ERRORS:
+                        error_msg = 'wrong latitude or longitude'
+                    raise WrongCoords(error_msg)
+
+                handled = _STATUS_EXCEPTIONS.get(response.status)
+                if handled is not None:
+                    exc_cls, msg = handled
+                    raise exc_cls(msg)
+                else:
+                    # Try to get the error message
+                    try:
+                        error_msg = _loads(await response.read()).get(
+                            'message', 'Unknown error'
+                        )
+                    except _DECODE_ERRORS:
+                        error_msg = f"HTTP {response.status}"
+                    raise PyOpenWeatherMapError(f'API error: {error_msg}')
+        except asyncio.TimeoutError:
+            raise PyOpenWeatherMapError(f'Request timed out after {self.timeout}s')
+        except aiohttp.ClientError as e:
+            raise PyOpenWeatherMapError(f'Request failed: {str(e)}')
+
+    async def get_current_weather_by_coords(self, lat: float, lon: float) -> CurrentWeather:
+        """
+        Get current weather by geographic coordinates
+
+        Args:
+            lat: Latitude
+            lon: Longitude
+
+        Returns:
+            CurrentWeather object with parsed weather data
+
+        Raises:
+            WrongCoords: If lat/lon are outside the valid range
+        """
+        # Reject out-of-range coordinates locally, same as the sync client
+        lat = float(lat)
+        lon = float(lon)
+        if not (-90.0 <= lat <= 90.0 and -180.0 <= lon <= 180.0):
+            raise WrongCoords(f"lat={lat}, lon={lon} out of range")
+
+        params = [
+            ('lat', lat),
+            ('lon', lon),
+            ('units', self.units),
+            ('appid', self.api_key)
+        ]
+
+        data = await self._make_request(CURRENT_WEATHER_ENDPOINT, params)
+        return CurrentWeather.from_api_response(data)
+
+    async def get_many(self, coord_list: List[Tuple[float, float]]) -> List[CurrentWeather]:
+        """
+        Get current weather for multiple coordinates concurrently
+
+        Args:
+            coord_list: Iterable of (lat, lon) pairs
+
+        Returns:
+            List of CurrentWeather objects, in the same order as coord_list
+        """
+        return await asyncio.gather(*[
+            self.get_current_weather_by_coords(lat, lon)
+            for lat, lon in coord_list
+        ])
\ No newline at end of file
@@ -5,9 +5,13 @@ BASE_URL = "https://api.openweathermap.org/data/2.5"
 # Endpoints
 CURRENT_WEATHER_ENDPOINT = "/weather"
 
+# Full endpoint URLs, joined once at import time
+CURRENT_WEATHER_URL = BASE_URL + CURRENT_WEATHER_ENDPOINT
+
 # Default config
 DEFAULT_TIMEOUT = 10 # seconds
 DEFAULT_UNITS = 'metric' # metric, imperial, standard
+DEFAULT_CACHE_TTL = 60 # seconds; 0 disables caching
 
-# Valid units
-VALID_UNITS = {'metric', 'imperial', 'standard'}
\ No newline at end of file
+# Valid units (frozen - membership-checked on every client construction)
+VALID_UNITS = frozenset({'metric', 'imperial', 'standard'})
\ No newline at end of file
@@ -7,15 +7,15 @@ class PyOpenWeatherMapError(Exception):
     catch all package-specific errors with:
         except PyOpenWeatherMapError:
     """
-    pass
 
 class AuthenticationError(PyOpenWeatherMapError):
     """Raised when API key is invalid or missing"""
-    pass
 
 class WrongCoords(PyOpenWeatherMapError):
     """Raised when a wrong latitude or longitude is used"""
-    pass
+
+class NotFoundError(PyOpenWeatherMapError):
+    """Raised when the requested location is not found"""
 
 class RateLimitError(PyOpenWeatherMapError):
     """
@@ -23,7 +23,6 @@ class RateLimitError(PyOpenWeatherMapError):
     
     OpenWeatherMap free tier has limits on requests per minute/day.
     """
-    pass
 
 
 class InvalidParameterError(PyOpenWeatherMapError):
@@ -35,7 +34,6 @@ class InvalidParameterError(PyOpenWeatherMapError):
         - Invalid date format
         - Out-of-range coordinates
     """
-    pass
 
 
 class APIError(PyOpenWeatherMapError):
@@ -43,5 +41,4 @@ class APIError(PyOpenWeatherMapError):
     Raised when API returns an unexpected error.
     
     Used for server errors or unknown issues.
-    """
-    pass
\ No newline at end of file
+    """
\ No newline at end of file
@@ -1,9 +1,30 @@
 """Data models for API responses"""
+# Aliased so it cannot collide with the local Sys instance in
+# from_api_response
+from sys import intern as _intern
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional, List
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, List
 
-@dataclass
+# datetime is only needed when a timestamp is actually converted, so it is
+# imported lazily inside those methods to keep bulk parsing and module
+# import off that cost
+if TYPE_CHECKING:
+    from datetime import datetime
+
+@lru_cache(maxsize=512)
+def _aware_from_timestamp(ts: int, offset_secs: int = 0) -> 'datetime':
+    """
+    Convert a unix timestamp to a timezone-aware datetime.
+
+    offset_secs is the UTC shift in secs (0 gives UTC). Results are
+    cached - the same timestamp is often converted repeatedly, e.g. when
+    stringifying the same record more than once.
+    """
+    from datetime import datetime, timedelta, timezone
+    return datetime.fromtimestamp(ts, tz=timezone(timedelta(seconds=offset_secs)))
+
+@dataclass(slots=True)
 class Coordinates:
     """
     Geographic coordinates
@@ -18,7 +39,7 @@ class Coordinates:
     def __str__(self) -> str:
         return f"({self.lat}, {self.lon})"
 
-@dataclass
+@dataclass(slots=True)
 class Weather:
     """
     Weather condition details
@@ -37,7 +58,7 @@ class Weather:
     def __str__(self):
         return f"{self.main}: {self.description}"
 
-@dataclass
+@dataclass(slots=True)
 class Main:
     """
     Main weather params
@@ -58,13 +79,13 @@ class Main:
     temp_max: float
     pressure: int
     humidity: int
-    sea_level: int
-    grnd_level: int
+    sea_level: Optional[int] = None
+    grnd_level: Optional[int] = None
 
     def __str__(self):
         return f"{self.temp}° (feels like {self.feels_like}°)"
     
-@dataclass
+@dataclass(slots=True)
 class Wind:
     """
     Wind information
@@ -76,12 +97,12 @@ class Wind:
     """
     speed: float
     deg: int
-    gust: float
+    gust: Optional[float] = None
 
     def __str__(self):
         return self.speed
 
-@dataclass
+@dataclass(slots=True)
 class Clouds:
     """
     Cloud information
@@ -94,7 +115,7 @@ class Clouds:
     def __str__(self):
         return f'{self.all}% clouds'
 
-@dataclass
+@dataclass(slots=True)
 class Rain:
     """
     Rainfall information
@@ -109,7 +130,7 @@ class Rain:
             return f"{self.one_h}mm (1h)"
         return "No rain data"
     
-@dataclass
+@dataclass(slots=True)
 class Snow:
     """
     Snow information
@@ -124,7 +145,7 @@ class Snow:
             return f"{self.one_h}mm (1h)"
         return "No snow data"
     
-@dataclass
+@dataclass(slots=True)
 class Sys:
     """
     System information
@@ -138,20 +159,20 @@ class Sys:
     sunrise: int
     sunset: int
 
-    def get_sunrise_time(self) -> datetime:
-        """Convert sunrise timestamp to datetime."""
-        return datetime.fromtimestamp(self.sunrise)
-    
-    def get_sunset_time(self) -> datetime:
-        """Convert sunset timestamp to datetime."""
-        return datetime.fromtimestamp(self.sunset)
+    def get_sunrise_time(self) -> 'datetime':
+        """Convert sunrise timestamp to a timezone-aware UTC datetime."""
+        return _aware_from_timestamp(self.sunrise)
+
+    def get_sunset_time(self) -> 'datetime':
+        """Convert sunset timestamp to a timezone-aware UTC datetime."""
+        return _aware_from_timestamp(self.sunset)
 
     def __str__(self) -> str:
         sunrise_str = self.get_sunrise_time().strftime("%H:%M")
         sunset_str = self.get_sunset_time().strftime("%H:%M")
         return f"Sunrise: {sunrise_str}, Sunset: {sunset_str}"
 
-@dataclass
+@dataclass(slots=True)
 class CurrentWeather:
     """Current weather data for a location"""
     coord: Coordinates
@@ -170,9 +191,9 @@ class CurrentWeather:
     rain: Optional[Rain] = None
     snow: Optional[Snow] = None
     
-    def get_timestamp(self) -> datetime:
-        """Convert dt to datetime object"""    
-        return datetime.fromtimestamp(self.dt)
+    def get_timestamp(self) -> 'datetime':
+        """Convert dt to a timezone-aware datetime in the location's local time"""
+        return _aware_from_timestamp(self.dt, self.timezone)
     
     def __str__(self):
         """Human readable weather summary"""
@@ -200,40 +221,41 @@ class CurrentWeather:
             >>> response = client.get_current_weather("London")
             >>> weather = CurrentWeather.from_api_response(response)
         """
-        # Parse coordinates
-        coord = Coordinates(
-            lat=data['coord']['lat'],
-            lon=data['coord']['lon']
-        )
-
-        # Parse weather conditions
+        # Hoist each sub-dict into a local once instead of re-indexing
+        # data[...] for every field
+        c = data['coord']
+        coord = Coordinates(lat=c['lat'], lon=c['lon'])
+
+        # Parse weather conditions, constructed positionally - this is the
+        # only per-record list in the payload and kwargs dispatch costs
+        # noticeably more in CPython. main/icon take only a handful of
+        # distinct values, so intern them - many records then share one
+        # str object and compare by pointer
         weather_list = [
-            Weather(
-                id=w['id'],
-                main=w['main'],
-                description=w['description'],
-                icon=w['icon']
-            )
+            Weather(w['id'], _intern(w['main']), w['description'], _intern(w['icon']))
             for w in data['weather']
         ]
 
-        # Parse main weather data
+        # Parse main weather data; sea_level/grnd_level can be absent
+        # in real responses
+        m = data['main']
         main = Main(
-            temp=data['main']['temp'],
-            feels_like=data['main']['feels_like'],
-            temp_min=data['main']['temp_min'],
-            temp_max=data['main']['temp_max'],
-            pressure=data['main']['pressure'],
-            humidity=data['main']['humidity'],
-            sea_level=data['main']['sea_level'],
-            grnd_level=data['main']['grnd_level']
+            temp=m['temp'],
+            feels_like=m['feels_like'],
+            temp_min=m['temp_min'],
+            temp_max=m['temp_max'],
+            pressure=m['pressure'],
+            humidity=m['humidity'],
+            sea_level=m.get('sea_level'),
+            grnd_level=m.get('grnd_level')
         )
 
-        # Parse wind
+        # Parse wind; gust can be absent in real responses
+        w = data['wind']
         wind = Wind(
-            speed=data['wind']['speed'],
-            deg=data['wind']['deg'],
-            gust=data['wind']['gust']
+            speed=w['speed'],
+            deg=w['deg'],
+            gust=w.get('gust')
         )
 
         # Parse clouds
@@ -250,20 +272,21 @@ class CurrentWeather:
         snow = None
         if 'snow' in data:
             snow = Snow(
-                one_h=data['rain'].get('1h')
+                one_h=data['snow'].get('1h')
             )
 
-        # Parse sys
+        # Parse sys; country codes are low-cardinality too
+        s = data['sys']
         sys = Sys(
-            country=data['sys']['country'],
-            sunrise=data['sys']['sunrise'],
-            sunset=data['sys']['sunset'],
+            country=_intern(s['country']),
+            sunrise=s['sunrise'],
+            sunset=s['sunset'],
         )
 
         return cls(
             coord=coord,
             weather=weather_list,
-            base=data['base'],
+            base=_intern(data['base']),
             main=main,
             visibility=data['visibility'],
             wind=wind,
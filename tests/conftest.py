@@ -0,0 +1,65 @@
+"""Shared fixtures for the test suite"""
+import socket
+import pytest
+from openweather_python import OpenWeatherMapClient
+
+@pytest.fixture(autouse=True)
+def block_network(monkeypatch):
+    """Fail fast if a test slips past the mocks and opens a real socket"""
+    def guard(self, *args, **kwargs):
+        raise RuntimeError('Test attempted real network access')
+    monkeypatch.setattr(socket.socket, 'connect', guard)
+
+@pytest.fixture(scope="module")
+def client():
+    """Create a test client, shared across each test module"""
+    return OpenWeatherMapClient(api_key='test-api-key')
+
+# Built once at import instead of per-fixture-scope; shared by
+# reference, so tests that mutate it must deepcopy first
+_MOCK_API_RESPONSE = {
+    "coord": {"lon": -0.13, "lat": 51.51},
+    "weather": [
+        {
+            "id": 300,
+            "main": "Drizzle",
+            "description": "light intensity drizzle",
+            "icon": "09d"
+        }
+    ],
+    "base": "stations",
+    "main": {
+        "temp": 280.32,
+        "feels_like": 278.43,
+        "temp_min": 279.15,
+        "temp_max": 281.15,
+        "pressure": 1012,
+        "humidity": 81,
+        "sea_level": 1012,
+        "grnd_level": 1010
+    },
+    "visibility": 10000,
+    "wind": {
+        "speed": 4.1,
+        "deg": 80,
+        "gust": 6.2
+    },
+    "clouds": {"all": 90},
+    "dt": 1485789600,
+    "sys": {
+        "type": 1,
+        "id": 5091,
+        "country": "GB",
+        "sunrise": 1485762037,
+        "sunset": 1485794875
+    },
+    "timezone": 0,
+    "id": 2643743,
+    "name": "London",
+    "cod": 200
+}
+
+@pytest.fixture(scope="session")
+def mock_api_response():
+    """Hand out the precompiled sample response"""
+    return _MOCK_API_RESPONSE
@@ -1,222 +1,453 @@
+import asyncio
+import copy
+import aiohttp
 import pytest
 import requests
-from unittest.mock import Mock, patch
-from openweather_python import OpenWeatherMapClient, CurrentWeather
+from types import SimpleNamespace
+from unittest.mock import patch
+from openweather_python import (
+    OpenWeatherMapClient, AsyncOpenWeatherMapClient, CurrentWeather
+)
 from openweather_python.exceptions import (
-    AuthenticationError, InvalidParameterError, WrongCoords, 
-    RateLimitError, PyOpenWeatherMapError
+    AuthenticationError, InvalidParameterError, WrongCoords,
+    NotFoundError, RateLimitError, PyOpenWeatherMapError
 )
 from openweather_python.constants import CURRENT_WEATHER_ENDPOINT, BASE_URL
 
-class TestClientInitialization:
-    """Tests for client initialization"""
-    def test_init_with_api_key(self):
-        """Test client initializes with API key"""
-        client = OpenWeatherMapClient(api_key='test_api_key')
-        assert client.api_key == 'test_api_key'
-        assert client.units == 'metric'
-        assert client.timeout == 10
-
-    @patch.dict('os.environ', {}, clear=True)
-    def test_init_without_api_key_raises_errors(self):
-        """Test client raises error when no API key is provided"""
-        with pytest.raises(AuthenticationError):
-            OpenWeatherMapClient()
-
-    def test_init_with_invalid_units_raises_errors(self):
-        """Test client raises error for invalid units"""
-        with pytest.raises(InvalidParameterError):
-            OpenWeatherMapClient(api_key='test_api_key', units='invalid')
-
-    @patch.dict('os.environ', {'OPENWEATHERMAP_API_KEY': 'test_api_key'})
-    def test_init_from_env_var(self):
-        """Test client reads API key from environment"""
-        client = OpenWeatherMapClient()
-        assert client.api_key == 'test_api_key'
-
-class TestMakeResult:
-    """Tests for _make_request private method"""
-    
-    @pytest.fixture
-    def client(self):
-        """Create a test client"""
-        return OpenWeatherMapClient(api_key='test-api-key')
-    
-    @pytest.fixture
-    def mock_success_response(self):
-        """Mock a successful response"""
-        mock_resp = Mock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {'test': 'data'}
-        return mock_resp
-    
-    @patch('openweather_python.client.requests.get')
-    def test_make_request_success(self, mock_get, client, mock_success_response):
-        """Test successful API request"""
-        mock_get.return_value = mock_success_response
-
-        result = client._make_request('/test', {'q': 'London'})
-
-        # Verify request was made successfully
-        mock_get.assert_called_once_with(
-            url=f"{BASE_URL}/test",
-            params={'q': 'London', 'appid': 'test-api-key'},
-            timeout=10
-        )
-        
-        assert result == {'test': 'data'}
-
-    @patch('openweather_python.client.requests.get')
-    def test_make_request_adds_api_key(self, mock_get, client, mock_success_response):
-        """Test API key is automatically added to params"""
-        mock_get.return_value = mock_success_response
-
-        client._make_request('/test', {'q': 'London'})
-
-        call_params = mock_get.call_args[1]['params']
-        assert 'appid' in call_params
-        assert call_params['appid'] == 'test-api-key'
-
-    @patch('openweather_python.client.requests.get')
-    def test_make_request_uses_custom_timeout(self, mock_get, mock_success_response):
-        """Test custom timeout is used"""
-        client = OpenWeatherMapClient(api_key='test_api_key', timeout=25)
-        mock_get.return_value = mock_success_response
-
-        client._make_request('/test', {'q': 'London'})
-
-        timeout = mock_get.call_args[1]['timeout']
-        assert timeout == 25
-
-    @patch('openweather_python.client.requests.get')
-    def test_make_request_401_raises_authentication_error(self, mock_get, client):
-        """Test 401 status code raise AuthenticationError"""
-        mock_resp = Mock()
-        mock_resp.status_code = 401
-        mock_get.return_value = mock_resp
-
-        with pytest.raises(AuthenticationError, match='Invalid API key'):
-            client._make_request('/test', {})
-
-    @patch('openweather_python.client.requests.get')
-    def test_make_request_400_raises_wrong_coords_error(self, mock_get, client):
-        "Test 400 status raise WrongCoords"
-        mock_resp = Mock()
-        mock_resp.status_code = 400
-        mock_resp.json.return_value = {"cod":"400","message":"wrong longitude"}
-        mock_get.return_value = mock_resp
-
-        with pytest.raises(WrongCoords, match='wrong'):
-            client._make_request('/test', {})
-
-    @patch('openweather_python.client.requests.get')
-    def test_make_request_429_raises_rate_limit_error(self, mock_get, client):
-        "Test 429 status raises RateLimitError"
-        mock_resp = Mock()
-        mock_resp.status_code = 429
-        mock_get.return_value = mock_resp
-
-        with pytest.raises(RateLimitError, match='API rate limit exceeded'):
-            client._make_request('/test', {})
-
-    @patch('openweather_python.client.requests.get')
-    def test_make_request_500_raises_api_error(self, mock_get, client):
-        """Test 5xx status code raises PyOpenWeatherMapError"""
-        mock_resp = Mock()
-        mock_resp.status_code = 500
-        mock_get.return_value = mock_resp
-
-        with pytest.raises(PyOpenWeatherMapError, match='API error'):
-            client._make_request('/test', {})
-
-    @patch('openweather_python.client.requests.get')
-    def test_make_request_timeout_raises_error(self, mock_get, client):
-        """Test request timeout is handled"""
-        mock_get.side_effect = requests.exceptions.Timeout()
-
-        with pytest.raises(PyOpenWeatherMapError, match='Request timed out'):
-            client._make_request('/test', {})
-
-    @patch('openweather_python.client.requests.get')
-    def test_make_request_generic_request_exception(self, mock_get, client):
-        """Test generic request exceptions are handled"""
-        mock_get.side_effect = requests.exceptions.RequestException('Unknown error')
-
-        with pytest.raises(PyOpenWeatherMapError, match='Request failed'):
-            client._make_request('/test', {})
-
-
-class TestCurrentWeatherByCoords:
-    """Tests for get_current_weather_by_coords method"""
-    @pytest.fixture
-    def mock_api_response(self):
-        """Sample response matching OpenWeatherMap structure"""
-        return {
-            "coord": {"lon": -0.13, "lat": 51.51},
-            "weather": [
-                {
-                    "id": 300,
-                    "main": "Drizzle",
-                    "description": "light intensity drizzle",
-                    "icon": "09d"
-                }
-            ],
-            "base": "stations",
-            "main": {
-                "temp": 280.32,
-                "feels_like": 278.43,
-                "temp_min": 279.15,
-                "temp_max": 281.15,
-                "pressure": 1012,
-                "humidity": 81,
-                "sea_level": 1012,
-                "grnd_level": 1010
-            },
-            "visibility": 10000,
-            "wind": {
-                "speed": 4.1,
-                "deg": 80,
-                "gust": 6.2
-            },
-            "clouds": {"all": 90},
-            "dt": 1485789600,
-            "sys": {
-                "type": 1,
-                "id": 5091,
-                "country": "GB",
-                "sunrise": 1485762037,
-                "sunset": 1485794875
-            },
-            "timezone": 0,
-            "id": 2643743,
-            "name": "London",
-            "cod": 200
-        }
-    
-    @patch('openweather_python.client.OpenWeatherMapClient._make_request')
-    def test_get_current_weather_by_coords(self, mock_make_request, mock_api_response):
-        """Test successful weather retrieval by coordinates"""
-        mock_make_request.return_value = mock_api_response
-
-        # Make request
+def _fake_resp(status=200, content=b'', headers=None):
+    """
+    Build a minimal response stand-in.
+
+    Only status_code/content/headers are read by the client, and a
+    SimpleNamespace is far cheaper to construct than a full Mock.
+    """
+    return SimpleNamespace(status_code=status, content=content, headers=headers or {})
+
+def _resolve_path(obj, path):
+    """Resolve a dotted attribute/index path like 'weather.0.description'"""
+    for part in path.split('.'):
+        obj = obj[int(part)] if part.isdigit() else getattr(obj, part)
+    return obj
+
+@pytest.fixture
+def mock_get():
+    """Patch Session.get for tests exercising the HTTP layer"""
+    with patch.object(requests.Session, 'get') as mock_get:
+        yield mock_get
+
+@pytest.fixture
+def mock_success_response():
+    """Mock a successful response"""
+    return _fake_resp(200, b'{"test": "data"}')
+
+@pytest.fixture(scope="module")
+def parsed_weather(mock_api_response):
+    """Parse the sample response once and share it across assertions"""
+    with patch.object(
+        OpenWeatherMapClient, '_make_request',
+        return_value=(mock_api_response, None)
+    ) as mock_make_request:
         client = OpenWeatherMapClient(api_key='test-api-key')
         weather = client.get_current_weather_by_coords(lat=51.51, lon=-0.13)
+    return weather, mock_make_request, client
+
+
+# --- Client initialization ---
+
+@pytest.mark.parametrize("kwargs,env_key,expected_key", [
+    ({'api_key': 'test_api_key'}, None, 'test_api_key'),
+    ({}, 'env_api_key', 'env_api_key'),
+])
+def test_init_valid(monkeypatch, kwargs, env_key, expected_key):
+    """Test client initializes from param or environment"""
+    monkeypatch.delenv('OPENWEATHERMAP_API_KEY', raising=False)
+    if env_key is not None:
+        monkeypatch.setenv('OPENWEATHERMAP_API_KEY', env_key)
+
+    client = OpenWeatherMapClient(**kwargs)
+
+    assert client.api_key == expected_key
+    assert client.units == 'metric'
+    assert client.timeout == 10
+
+@pytest.mark.parametrize("kwargs,exc", [
+    ({}, AuthenticationError),
+    ({'api_key': 'test_api_key', 'units': 'invalid'}, InvalidParameterError),
+])
+def test_init_invalid(monkeypatch, kwargs, exc):
+    """Test missing key / invalid units raise the right error"""
+    monkeypatch.delenv('OPENWEATHERMAP_API_KEY', raising=False)
+
+    with pytest.raises(exc):
+        OpenWeatherMapClient(**kwargs)
+
+
+# --- _make_request ---
+
+def test_make_request_success(mock_get, client, mock_success_response):
+    """Test a successful request, including the auto-added API key"""
+    mock_get.return_value = mock_success_response
+
+    data, max_age = client._make_request('/test', {'q': 'London'})
+
+    # The full-call assertion already covers appid injection
+    mock_get.assert_called_once_with(
+        url=f"{BASE_URL}/test",
+        params={'q': 'London', 'appid': 'test-api-key'},
+        timeout=10,
+        headers=None
+    )
+
+    assert data == {'test': 'data'}
+    assert max_age is None
+
+def test_make_request_returns_cache_control_max_age(mock_get, client):
+    """Test the Cache-Control max-age is returned alongside the body"""
+    mock_get.return_value = _fake_resp(
+        200, b'{"test": "data"}', headers={'Cache-Control': 'max-age=120'}
+    )
+
+    _, max_age = client._make_request('/test', {})
+
+    assert max_age == 120
+
+def test_make_request_uses_custom_timeout(mock_get, mock_success_response):
+    """Test custom timeout is used"""
+    client = OpenWeatherMapClient(api_key='test_api_key', timeout=25)
+    mock_get.return_value = mock_success_response
+
+    client._make_request('/test', {'q': 'London'})
+
+    timeout = mock_get.call_args[1]['timeout']
+    assert timeout == 25
+
+def test_make_request_400_raises_wrong_coords_error(mock_get, client):
+    "Test 400 status raise WrongCoords"
+    mock_get.return_value = _fake_resp(
+        400, b'{"cod": "400", "message": "wrong longitude"}'
+    )
+
+    with pytest.raises(WrongCoords, match='wrong'):
+        client._make_request('/test', {})
+
+@pytest.mark.parametrize("status,exc,match", [
+    (401, AuthenticationError, 'Invalid API key'),
+    (404, NotFoundError, 'Location not found'),
+    (429, RateLimitError, 'API rate limit exceeded'),
+    (500, PyOpenWeatherMapError, 'API error'),
+])
+def test_make_request_error_statuses(mock_get, client, status, exc, match):
+    """Test each error status raises its mapped exception"""
+    mock_get.return_value = _fake_resp(status)
+
+    with pytest.raises(exc, match=match):
+        client._make_request('/test', {})
+
+@pytest.mark.parametrize("side_effect,match", [
+    (requests.exceptions.Timeout(), 'Request timed out'),
+    (requests.exceptions.RequestException('Unknown error'), 'Request failed'),
+])
+def test_make_request_transport_errors(mock_get, client, side_effect, match):
+    """Test transport-level failures are wrapped in PyOpenWeatherMapError"""
+    mock_get.side_effect = side_effect
+
+    with pytest.raises(PyOpenWeatherMapError, match=match):
+        client._make_request('/test', {})
+
+def test_make_request_304_returns_etag_cached_body(mock_get):
+    """Test a 304 revalidation reuses the previously decoded body"""
+    client = OpenWeatherMapClient(api_key='test-api-key')
+    mock_get.return_value = _fake_resp(
+        200, b'{"test": "data"}', headers={'ETag': '"abc123"'}
+    )
+
+    first, _ = client._make_request('/test', {})
+
+    mock_get.return_value = _fake_resp(304)
+
+    second, _ = client._make_request('/test', {})
+
+    # Second call revalidated with the stored ETag and reused the body
+    assert mock_get.call_args[1]['headers'] == {'If-None-Match': '"abc123"'}
+    assert second == first
+
+
+# --- get_current_weather_by_coords ---
+
+def test_get_current_weather_by_coords(parsed_weather):
+    """Test the request is issued correctly and parses to a model"""
+    weather, mock_make_request, client = parsed_weather
+
+    # Verify make request was called correctly
+    mock_make_request.assert_called_once_with(
+        CURRENT_WEATHER_ENDPOINT,
+        [
+            ('lat', 51.51),
+            ('lon', -0.13),
+            ('units', client.units),
+            ('appid', client.api_key)
+        ]
+    )
+
+    assert isinstance(weather, CurrentWeather)
+
+@pytest.mark.parametrize("path,expected", [
+    ("name", "London"),
+    ("coord.lat", 51.51),
+    ("coord.lon", -0.13),
+    ("main.temp", 280.32),
+    ("weather.0.description", "light intensity drizzle"),
+    ("sys.country", "GB"),
+])
+def test_parsed_weather_fields(parsed_weather, path, expected):
+    """Test each field of the parsed model without re-parsing"""
+    weather, _, _ = parsed_weather
+    assert _resolve_path(weather, path) == expected
+
+@patch.object(OpenWeatherMapClient, '_make_request')
+def test_out_of_range_coords_rejected_locally(mock_make_request):
+    """Test invalid coordinates raise WrongCoords without a request"""
+    client = OpenWeatherMapClient(api_key='test-api-key')
+
+    with pytest.raises(WrongCoords, match='out of range'):
+        client.get_current_weather_by_coords(lat=999, lon=999)
+
+    mock_make_request.assert_not_called()
+
+def test_get_many_returns_results_in_order():
+    """Test the threaded batch lookup preserves input order"""
+    client = OpenWeatherMapClient(api_key='test-api-key')
+    coords = [(51.51, -0.13), (48.86, 2.35), (35.68, 139.65)]
+
+    with patch.object(
+        client, 'get_current_weather_by_coords',
+        side_effect=lambda lat, lon: (lat, lon)
+    ):
+        results = client.get_many(coords)
+
+    assert results == coords
+
+def test_get_many_with_empty_list():
+    """Test an empty batch returns an empty list without spawning threads"""
+    client = OpenWeatherMapClient(api_key='test-api-key')
+    assert client.get_many([]) == []
+
+def test_from_api_response_handles_missing_optional_keys(mock_api_response):
+    """Test absent sea_level/grnd_level/gust default to None"""
+    mock_api_response = copy.deepcopy(mock_api_response)
+    del mock_api_response['main']['sea_level']
+    del mock_api_response['main']['grnd_level']
+    del mock_api_response['wind']['gust']
+
+    weather = CurrentWeather.from_api_response(mock_api_response)
+
+    assert weather.main.sea_level is None
+    assert weather.main.grnd_level is None
+    assert weather.wind.gust is None
 
-        # Verify make request was called correctly
-        mock_make_request.assert_called_once_with(
-            CURRENT_WEATHER_ENDPOINT,
-            {
-                'lat': 51.51,
-                'lon': -0.13,
-                'units': client.units
-            }
+def test_get_timestamp_applies_location_offset(mock_api_response):
+    """Test dt conversion is timezone-aware using the location's shift"""
+    mock_api_response = copy.deepcopy(mock_api_response)
+    mock_api_response['timezone'] = 3600
+
+    weather = CurrentWeather.from_api_response(mock_api_response)
+    timestamp = weather.get_timestamp()
+
+    assert timestamp.utcoffset().total_seconds() == 3600
+    assert int(timestamp.timestamp()) == mock_api_response['dt']
+
+def test_from_api_response_parses_rain_and_snow(mock_api_response):
+    """Test rain and snow are read from their own response blocks"""
+    mock_api_response = copy.deepcopy(mock_api_response)
+    mock_api_response['rain'] = {'1h': 0.5}
+    mock_api_response['snow'] = {'1h': 1.2}
+
+    weather = CurrentWeather.from_api_response(mock_api_response)
+
+    assert weather.rain.one_h == 0.5
+    assert weather.snow.one_h == 1.2
+
+
+# --- TTL result cache ---
+
+@patch.object(OpenWeatherMapClient, '_make_request')
+def test_repeated_lookup_served_from_cache(mock_make_request, mock_api_response):
+    """Test a second lookup for the same coords skips the network"""
+    mock_make_request.return_value = (mock_api_response, None)
+
+    client = OpenWeatherMapClient(api_key='test-api-key')
+    first = client.get_current_weather_by_coords(lat=51.51, lon=-0.13)
+    second = client.get_current_weather_by_coords(lat=51.51, lon=-0.13)
+
+    mock_make_request.assert_called_once()
+    assert second is first
+
+@patch.object(OpenWeatherMapClient, '_make_request')
+def test_expired_entry_is_refetched(mock_make_request, mock_api_response):
+    """Test a stale cache entry triggers a fresh request"""
+    mock_make_request.return_value = (mock_api_response, None)
+
+    client = OpenWeatherMapClient(api_key='test-api-key', cache_ttl=60)
+    client.get_current_weather_by_coords(lat=51.51, lon=-0.13)
+
+    # Age the cached entry past its TTL
+    key, (fetched_at, ttl, weather) = next(iter(client._cache.items()))
+    client._cache[key] = (fetched_at - ttl - 1, ttl, weather)
+
+    client.get_current_weather_by_coords(lat=51.51, lon=-0.13)
+    assert mock_make_request.call_count == 2
+
+@patch.object(OpenWeatherMapClient, '_make_request')
+def test_cache_disabled_with_zero_ttl(mock_make_request, mock_api_response):
+    """Test cache_ttl=0 disables caching entirely"""
+    mock_make_request.return_value = (mock_api_response, None)
+
+    client = OpenWeatherMapClient(api_key='test-api-key', cache_ttl=0)
+    client.get_current_weather_by_coords(lat=51.51, lon=-0.13)
+    client.get_current_weather_by_coords(lat=51.51, lon=-0.13)
+
+    assert mock_make_request.call_count == 2
+
+@patch.object(OpenWeatherMapClient, '_make_request')
+def test_different_coords_are_cached_separately(mock_make_request, mock_api_response):
+    """Test lookups for different coords each hit the network"""
+    mock_make_request.return_value = (mock_api_response, None)
+
+    client = OpenWeatherMapClient(api_key='test-api-key')
+    client.get_current_weather_by_coords(lat=51.51, lon=-0.13)
+    client.get_current_weather_by_coords(lat=48.86, lon=2.35)
+
+    assert mock_make_request.call_count == 2
+
+@patch.object(OpenWeatherMapClient, '_make_request')
+def test_server_max_age_overrides_default_ttl(mock_make_request, mock_api_response):
+    """Test an entry is stored with the max-age returned by its own fetch"""
+    mock_make_request.return_value = (mock_api_response, 120)
+
+    client = OpenWeatherMapClient(api_key='test-api-key', cache_ttl=60)
+    client.get_current_weather_by_coords(lat=51.51, lon=-0.13)
+
+    _, ttl, _ = next(iter(client._cache.values()))
+    assert ttl == 120
+
+
+# --- AsyncOpenWeatherMapClient ---
+
+class _FakeAsyncResponse:
+    """
+    Minimal aiohttp response stand-in.
+
+    Acts as its own async context manager, matching how the client uses
+    the object returned by session.get().
+    """
+    def __init__(self, status=200, content=b''):
+        self.status = status
+        self._content = content
+
+    async def read(self):
+        return self._content
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+def _client_with_fake_session(get):
+    """Build an async client whose session get() is the given callable"""
+    client = AsyncOpenWeatherMapClient(api_key='test-api-key')
+    client._session = SimpleNamespace(get=get)
+    return client
+
+def test_async_init_without_api_key_raises_errors(monkeypatch):
+    """Test async client raises error when no API key is provided"""
+    monkeypatch.delenv('OPENWEATHERMAP_API_KEY', raising=False)
+
+    with pytest.raises(AuthenticationError):
+        AsyncOpenWeatherMapClient()
+
+def test_async_init_with_invalid_units_raises_errors():
+    """Test async client raises error for invalid units"""
+    with pytest.raises(InvalidParameterError):
+        AsyncOpenWeatherMapClient(api_key='test_api_key', units='invalid')
+
+def test_async_request_without_open_session_raises_error():
+    """Test using the client outside 'async with' raises an error"""
+    client = AsyncOpenWeatherMapClient(api_key='test-api-key')
+
+    with pytest.raises(PyOpenWeatherMapError, match='session is not open'):
+        asyncio.run(client._make_request('/test', {}))
+
+def test_async_out_of_range_coords_rejected_locally():
+    """Test invalid coordinates raise WrongCoords without a request"""
+    client = AsyncOpenWeatherMapClient(api_key='test-api-key')
+
+    with pytest.raises(WrongCoords, match='out of range'):
+        asyncio.run(client.get_current_weather_by_coords(lat=999, lon=999))
+
+def test_async_get_many_fetches_all_coords_concurrently():
+    """Test get_many gathers one result per coordinate pair, in order"""
+    client = AsyncOpenWeatherMapClient(api_key='test-api-key')
+    coords = [(51.51, -0.13), (48.86, 2.35), (35.68, 139.65)]
+
+    async def fake_get(lat, lon):
+        return (lat, lon)
+
+    with patch.object(client, 'get_current_weather_by_coords', side_effect=fake_get):
+        results = asyncio.run(client.get_many(coords))
+
+    assert results == coords
+
+def test_async_make_request_success():
+    """Test a successful async request decodes the body and adds the key"""
+    calls = []
+
+    def fake_get(url, params):
+        calls.append((url, params))
+        return _FakeAsyncResponse(200, b'{"test": "data"}')
+
+    client = _client_with_fake_session(fake_get)
+    result = asyncio.run(client._make_request('/test', {'q': 'London'}))
+
+    assert result == {'test': 'data'}
+    assert calls == [(f"{BASE_URL}/test", {'q': 'London', 'appid': 'test-api-key'})]
+
+def test_async_make_request_400_raises_wrong_coords_error():
+    """Test a 400 surfaces the message from the response body"""
+    client = _client_with_fake_session(
+        lambda url, params: _FakeAsyncResponse(
+            400, b'{"cod": "400", "message": "wrong longitude"}'
         )
+    )
+
+    with pytest.raises(WrongCoords, match='wrong'):
+        asyncio.run(client._make_request('/test', {}))
+
+@pytest.mark.parametrize("status,exc,match", [
+    (401, AuthenticationError, 'Invalid API key'),
+    (404, NotFoundError, 'Location not found'),
+    (429, RateLimitError, 'API rate limit exceeded'),
+    (500, PyOpenWeatherMapError, 'API error'),
+])
+def test_async_make_request_error_statuses(status, exc, match):
+    """Test each error status raises its mapped exception"""
+    client = _client_with_fake_session(
+        lambda url, params: _FakeAsyncResponse(status)
+    )
+
+    with pytest.raises(exc, match=match):
+        asyncio.run(client._make_request('/test', {}))
+
+@pytest.mark.parametrize("side_effect,match", [
+    (asyncio.TimeoutError(), 'Request timed out'),
+    (aiohttp.ClientError('Unknown error'), 'Request failed'),
+])
+def test_async_make_request_transport_errors(side_effect, match):
+    """Test transport-level failures are wrapped in PyOpenWeatherMapError"""
+    def fake_get(url, params):
+        raise side_effect
+
+    client = _client_with_fake_session(fake_get)
 
-        # Assertions
-        assert isinstance(weather, CurrentWeather)
-        assert weather.name == "London"
-        assert weather.coord.lat == 51.51
-        assert weather.coord.lon == -0.13
-        assert weather.main.temp == 280.32
-        assert weather.weather[0].description == "light intensity drizzle"
-        assert weather.sys.country == "GB"
+    with pytest.raises(PyOpenWeatherMapError, match=match):
+        asyncio.run(client._make_request('/test', {}))